@@ -1,5 +1,4 @@
 import argparse
-import logging
 import sys
 import time
 from pathlib import Path
@@ -8,7 +7,7 @@ from dotenv import load_dotenv
 
 # Importamos nuestro pipeline
 from src.pipeline import run_pipeline
-from src.utils import setup_logger
+from src.utils import configure_logging, setup_logger
 
 # Configuración inicial del logger para el entry point
 logger = setup_logger("Entrypoint")
@@ -18,7 +17,7 @@ def parse_args():
     """
     Parsea los argumentos de línea de comandos.
     Esto permite ejecutar el script con opciones como:
-    python main.py --env prod --verbose
+    python main.py --env prod --verbose --emit-csv
     """
     parser = argparse.ArgumentParser(description="NYC Collisions ETL Pipeline")
 
@@ -36,6 +35,12 @@ def parse_args():
         help="Increase output verbosity to DEBUG",
     )
 
+    parser.add_argument(
+        "--emit-csv",
+        action="store_true",
+        help="Also export the Gold daily stats as CSV (default: Parquet only)",
+    )
+
     return parser.parse_args()
 
 
@@ -53,10 +58,9 @@ def main():
     # Cargar variables de entorno desde .env si existe
     load_dotenv()
 
-    # Ajustar nivel de log según el flag --verbose
-    if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
-        logger.debug("Debug mode enabled.")
+    # Configurar el logging una única vez, ajustando el nivel según el flag --verbose
+    configure_logging(verbose=args.verbose)
+    logger.debug("Debug mode enabled.")
 
     logger.info(f"Starting ETL Pipeline in environment: {args.env.upper()}")
 
@@ -64,7 +68,7 @@ def main():
     try:
         # Aquí lanzamos el pipeline.
         # Nota: Podrías pasar 'args.env' a run_pipeline si tu config soporta entornos.
-        run_pipeline()
+        run_pipeline(emit_csv=args.emit_csv)
 
         elapsed = time.time() - start_time
         logger.info(f"Pipeline completed successfully in {elapsed:.2f} seconds.")
@@ -1,29 +1,77 @@
-import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type, Union
 
+import orjson
 import polars as pl
 import requests
+import urllib3
 
-from ..utils import ensure_directory, setup_logger, setup_session
+from ..utils import setup_cached_session, setup_logger, setup_session
 
 logger = setup_logger(__name__)
 
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB per read/write amortizes syscall and TLS record overhead
+HOLIDAYS_MAX_WORKERS = 8  # Concurrent per-year requests to the holidays API
+DOWNLOAD_MAX_WORKERS = 8  # Concurrent file downloads in download_many
+
+# Known dtypes of the NYC collisions CSV, applied by the parser itself (no post-parse casting needed in Silver)
+COLLISION_SCHEMA = {
+    "CRASH DATE": pl.String,
+    "CRASH TIME": pl.String,
+    "BOROUGH": pl.String,
+    "LATITUDE": pl.Float64,
+    "LONGITUDE": pl.Float64,
+    "LOCATION": pl.String,
+    "ON STREET NAME": pl.String,
+    "CROSS STREET NAME": pl.String,
+    "OFF STREET NAME": pl.String,
+    "NUMBER OF PERSONS INJURED": pl.Int32,
+    "NUMBER OF PERSONS KILLED": pl.Int32,
+    "NUMBER OF PEDESTRIANS INJURED": pl.Int32,
+    "NUMBER OF PEDESTRIANS KILLED": pl.Int32,
+    "NUMBER OF CYCLIST INJURED": pl.Int32,
+    "NUMBER OF CYCLIST KILLED": pl.Int32,
+    "NUMBER OF MOTORIST INJURED": pl.Int32,
+    "NUMBER OF MOTORIST KILLED": pl.Int32,
+    **{f"CONTRIBUTING FACTOR VEHICLE {i}": pl.String for i in range(1, 6)},
+    "COLLISION_ID": pl.UInt64,
+    **{f"VEHICLE TYPE CODE {i}": pl.String for i in range(1, 6)},
+}
+
 
 class BronzeExtractor:
-    def __init__(self, config: dict):
+    def __init__(self, config: Mapping):
         self.config = config
 
         # Create a session to reuse TCP connections and handle retries
         self.session = setup_session()
 
-    def download_file_from_url(self, url: str, output_path: Path) -> Tuple[pl.DataFrame, Path]:
+        # Holidays are static per year: optionally serve repeat API calls from an on-disk cache (cache_http: true)
+        self.api_session = self.session
+        if config.get("sources", {}).get("holidays", {}).get("cache_http", False):
+            self.api_session = setup_cached_session(Path(config["paths"]["bronze"]) / ".http_cache.sqlite")
+
+    def download_file_from_url(
+        self,
+        url: str,
+        output_path: Path,
+        schema_overrides: Optional[Mapping[str, Union[Type[pl.DataType], pl.DataType]]] = None,
+    ) -> Tuple[pl.LazyFrame, Path]:
         """
-        Downloads a file directly to disk and loads it into a dataframe.
+        Downloads a CSV directly to disk and converts it once to Parquet (zstd) with the streaming engine.
+        Returns a lazy scan over the Parquet file so downstream layers get column/predicate pushdown.
+
+        Args:
+            output_path: Target CSV file. Its folder must already exist (created upfront by ensure_directories).
+            schema_overrides: Known column dtypes, applied by the CSV parser instead of inferring them.
         """
         logger.info(f"Downloading data from {url}...")
 
-        ensure_directory(output_path)
+        parquet_path = output_path.with_suffix(".parquet")
 
         # 1. Check if cached
         if output_path.exists():
@@ -31,27 +79,97 @@ class BronzeExtractor:
         else:
             try:
                 # 2. Download and Write (Stream to disk to save RAM)
-                response = self.session.get(url, stream=True, timeout=60)
-                response.raise_for_status()
-
-                with open(output_path, "wb") as f:
-                    # Write in chunks
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+                with self.session.get(url, stream=True, timeout=60) as response:
+                    response.raise_for_status()
+                    self._stream_to_disk(response, output_path)
 
                 logger.info(f"Saved to {output_path}")
 
-            except requests.exceptions.RequestException as e:
+                # A fresh CSV invalidates any Parquet built from a previous download
+                parquet_path.unlink(missing_ok=True)
+
+            # Reading response.raw directly surfaces urllib3 errors (e.g. a dropped connection) as well
+            except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
                 logger.error(f"Network error downloading {url}: {e}")
                 # Delete incomplete file if download failed
                 if output_path.exists():
                     output_path.unlink()
                 raise
 
-        # 3. Read into Polars
-        df = pl.read_csv(output_path, ignore_errors=True, infer_schema_length=10000)
+        # 3. Convert to Parquet once (row groups are written incrementally, so RAM stays bounded)
+        if not parquet_path.exists():
+            logger.info(f"Converting {output_path} to Parquet...")
+            if schema_overrides:
+                # Polars maps overrides by position when a name is missing from the header, so keep only real columns
+                header = pl.read_csv(output_path, n_rows=0).columns
+                schema_overrides = {col: dtype for col, dtype in schema_overrides.items() if col in header}
+
+            # Written to a temp file and renamed, so a failed conversion never leaves a broken Parquet behind as "cached"
+            fd, tmp_name = tempfile.mkstemp(prefix=f".{parquet_path.name}.", dir=parquet_path.parent)
+            os.close(fd)
+            try:
+                pl.scan_csv(
+                    output_path,
+                    ignore_errors=True,
+                    infer_schema_length=10000,
+                    schema_overrides=schema_overrides,
+                    rechunk=False,
+                    low_memory=True,
+                ).sink_parquet(tmp_name, compression="zstd")
+                os.replace(tmp_name, parquet_path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+
+        # 4. Lazy scan (parsed once, by whoever collects it)
+        lf = pl.scan_parquet(parquet_path)
+
+        return lf, parquet_path
+
+    def download_many(self, downloads: List[Dict[str, Any]]) -> List[Tuple[pl.LazyFrame, Path]]:
+        """
+        Runs several download_file_from_url calls concurrently. The first failure is re-raised.
+
+        Args:
+            downloads: One dict of download_file_from_url keyword arguments per file (url, output_path, ...).
 
-        return df, output_path
+        Returns:
+            List[Tuple[pl.LazyFrame, Path]]: One result per download, in input order.
+        """
+        if not downloads:
+            return []
+
+        max_workers = min(DOWNLOAD_MAX_WORKERS, len(downloads))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="download") as executor:
+            futures = [executor.submit(self.download_file_from_url, **kwargs) for kwargs in downloads]
+            return [future.result() for future in futures]
+
+    def _stream_to_disk(self, response: requests.Response, output_path: Path):
+        """
+        Copies the raw response body to disk in 1 MiB blocks with shutil.copyfileobj (C-level buffered copy),
+        decoding any gzip/deflate transfer encoding on the fly.
+        """
+        response.raw.decode_content = True
+        with open(output_path, "wb") as f:
+            shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+
+    def _fetch_holidays_for_year(self, base_url: str, country: str, year: int) -> List[dict]:
+        """
+        Fetches the holidays of a single year. A failed year is logged and skipped (returns an empty list).
+        """
+        url = f"{base_url}/{year}/{country}"
+        logger.info(f"Fetching holidays for {year}...")
+
+        try:
+            # Reuse session (served from the HTTP cache when enabled)
+            response = self.api_session.get(url, timeout=10)
+            response.raise_for_status()
+            holidays: List[dict] = response.json()
+            return holidays
+
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Could not fetch holidays for {year}: {e}")
+            return []
 
     def fetch_holidays(
         self,
@@ -62,37 +180,27 @@ class BronzeExtractor:
     ) -> Tuple[pl.DataFrame, Path]:
         """
         Fetches holidays from API, saves them to disk (Bronze) and returns the DataFrame for processing.
+        The folder of output_path must already exist (created upfront by ensure_directories).
 
         Returns:
             Tuple[Path, pl.DataFrame]: (Path to saved JSON, Polars DataFrame)
         """
-        ensure_directory(output_path)
-
         all_holidays = []
 
-        # Based on API design
-        for year in years:
-            url = f"{base_url}/{year}/{country}"
-            logger.info(f"Fetching holidays for {year}...")
-
-            try:
-                # Reuse session
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
-
+        # Based on API design: one small request per year. They are independent, so they are fanned out over a few threads
+        # sharing the session's keep-alive connection pool. executor.map keeps the results in year order.
+        max_workers = max(1, min(HOLIDAYS_MAX_WORKERS, len(years)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="holidays") as executor:
+            for year_holidays in executor.map(lambda year: self._fetch_holidays_for_year(base_url, country, year), years):
                 # Append data to our list (for every year)
-                all_holidays.extend(response.json())
-
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Could not fetch holidays for {year}: {e}")
+                all_holidays.extend(year_holidays)
 
         # Guard Clause
         if not all_holidays:
             raise RuntimeError("No holidays data fetched. Check API availability.")
 
-        # 1. Save to disk (Bronze Layer)
-        with open(output_path, "w") as f:
-            json.dump(all_holidays, f, indent=2)
+        # 1. Save to disk (Bronze Layer). Compact output: Bronze is machine-read (pretty-print with `jq` if needed)
+        output_path.write_bytes(orjson.dumps(all_holidays))
 
         logger.info(f"Holidays persisted to {output_path}")
 
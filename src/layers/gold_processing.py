@@ -11,7 +11,7 @@ logger = setup_logger(__name__)
 class GoldProcessor:
     """
     Handles the Gold Layer lifecycle.
-    Can ingest data from Disk (Path) OR Memory (DataFrame) for optimization.
+    Can ingest data from Disk (Path) OR Memory (DataFrame/LazyFrame) for optimization.
     """
 
     METRIC_COLS = [
@@ -25,13 +25,18 @@ class GoldProcessor:
         "number_of_motorist_killed",
     ]
 
-    def _normalize_input(self, input_data: Union[pl.DataFrame, Path], table_name: str = "") -> pl.LazyFrame:
+    def _normalize_input(self, input_data: Union[pl.DataFrame, pl.LazyFrame, Path], table_name: str = "") -> pl.LazyFrame:
         """
         Polymorphic helper:
         - If Input is DataFrame -> Convert to LazyFrame (Memory Optimization)
+        - If Input is LazyFrame -> Use it as is (e.g. a scan over the Silver output)
         - If Input is Path -> Scan Parquet files (Disk Reading)
         """
-        if isinstance(input_data, pl.DataFrame):
+        if isinstance(input_data, pl.LazyFrame):
+            logger.info(f"Input '{table_name}': Using LazyFrame")
+            return input_data
+
+        elif isinstance(input_data, pl.DataFrame):
             logger.info(f"Input '{table_name}': Using In-Memory DataFrame")
             return input_data.lazy()
 
@@ -40,7 +45,8 @@ class GoldProcessor:
             # If input_data already points to the table root, we just append glob
             full_path = input_data / "**/*.parquet"
             logger.info(f"Input '{table_name}': Scanning Disk at {full_path}")
-            return pl.scan_parquet(str(full_path))
+            # hive_partitioning exposes the year=/month= folders, so filters on them skip whole files at plan time
+            return pl.scan_parquet(str(full_path), hive_partitioning=True)
 
         else:
             raise TypeError(f"Unsupported input type for {table_name}: {type(input_data)}")
@@ -52,38 +58,37 @@ class GoldProcessor:
         lf_weather: pl.LazyFrame,
     ) -> pl.DataFrame:
         """
-        Joins Collisions with Holidays & Weather, then calculates impact flags.
+        Joins Collisions with Holidays & Weather, then fills the impact flags for non-matching days.
         """
         logger.info("Applying Business Rules: Joining Collisions, Holidays & Weather...")
-        # 1. Clean Weather: Select ONLY what we need (Drop 'year', 'month' to avoid conflicts)
-        weather_clean = lf_weather.select(["date", "temp_max_c", "temp_min_c", "has_rain", "has_snow", "is_foggy"])
+        # 1. Clean Holidays & Weather: Select ONLY what we need (Drop 'year', 'month' to avoid conflicts)
+        # Both are small dimension tables (a few thousand rows), so they are materialized once here and the joins
+        # build their hash tables from memory instead of re-scanning the partitioned files. Sorting the huge
+        # collisions side for a merge join would cost far more than hashing these small right-hand sides.
+        holidays_clean = lf_holidays.select(
+            ["date", "holiday_name", "high_impact_holiday", "partial_impact_holiday", "low_impact_holiday"]
+        ).collect()
+        weather_clean = lf_weather.select(["date", "max_temp", "min_temp", "has_rain", "has_snow", "is_foggy"]).collect()
 
         q = (
-            lf_collisions.filter(pl.col("date").dt.year() >= 2020)
+            # Filter on the partition key (not on date) so partitions before 2020 are pruned instead of scanned
+            lf_collisions.filter(pl.col("year") >= 2020)
             # 1. Join Holidays & Weather
-            .join(lf_holidays, on="date", how="left")
-            .join(weather_clean, on="date", how="left")
+            .join(holidays_clean.lazy(), on="date", how="left")
+            .join(weather_clean.lazy(), on="date", how="left")
             .with_columns(
                 [
                     # --- Holiday Logic ---
                     pl.col("holiday_name").fill_null("Non-Holiday"),
-                    (pl.col("types").list.contains("Public") | pl.col("types").list.contains("Bank"))
-                    .fill_null(False)
-                    .alias("high_impact_holiday"),
-                    (pl.col("types").list.contains("School") | pl.col("types").list.contains("Authorities"))
-                    .fill_null(False)
-                    .alias("partial_impact_holiday"),
-                    (pl.col("types").list.contains("Optional") | pl.col("types").list.contains("Observance"))
-                    .fill_null(False)
-                    .alias("low_impact_holiday"),
+                    # Impact flags are precomputed in Silver: non-holiday days are simply not high/partial/low impact
+                    pl.col("high_impact_holiday").fill_null(False),
+                    pl.col("partial_impact_holiday").fill_null(False),
+                    pl.col("low_impact_holiday").fill_null(False),
                     # --- Weather Logic ---
                     # Boolean flags: Fill missing days with False (safe assumption)
                     pl.col("has_rain").fill_null(False),
                     pl.col("has_snow").fill_null(False),
                     pl.col("is_foggy").fill_null(False),
-                    # I am renaming them here slightly for cleaner reading
-                    pl.col("temp_max_c").alias("max_temp"),
-                    pl.col("temp_min_c").alias("min_temp"),
                 ]
             )
         )
@@ -120,14 +125,16 @@ class GoldProcessor:
 
     def process_gold_data(
         self,
-        collisions_data: Union[pl.DataFrame, Path],
-        holidays_data: Union[pl.DataFrame, Path],
-        weather_data: Union[pl.DataFrame, Path],
+        collisions_data: Union[pl.DataFrame, pl.LazyFrame, Path],
+        holidays_data: Union[pl.DataFrame, pl.LazyFrame, Path],
+        weather_data: Union[pl.DataFrame, pl.LazyFrame, Path],
         gold_base_path: Path,
+        write_csv: bool = False,
     ):
         """
         Main entry point for Gold processing.
-        Accepts either DataFrames (from previous step) or Paths (from disk).
+        Accepts DataFrames/LazyFrames (from previous step) or Paths (from disk).
+        The CSV export is optional (write_csv) and streamed from the Parquet output.
         """
         # 1. Normalize Inputs
         lf_collisions = self._normalize_input(collisions_data, "collisions")
@@ -137,17 +144,24 @@ class GoldProcessor:
         # 2. Transformation Chain
         df_enriched = self._enrich_collisions(lf_collisions, lf_holidays, lf_weather)
         df_gold = self._aggregate_stats(df_enriched)
+        # The row-level frame is no longer needed: release it before persisting (and the optional CSV export)
+        del df_enriched
 
         # 3. Persist to Gold
         clean_output_directory(gold_base_path)
 
         parquet_path = gold_base_path / "daily_stats.parquet"
 
-        # I create this csv in case a business users wants to do an analysis in Excel
-        csv_path = gold_base_path / "daily_stats.csv"
-
         logger.info(f"Persisting Gold Data to {gold_base_path}...")
         df_gold.write_parquet(parquet_path)
-        df_gold.write_csv(csv_path)
+
+        # I create this csv in case a business users wants to do an analysis in Excel
+        if write_csv:
+            csv_path = gold_base_path / "daily_stats.csv"
+
+            # Free the in-memory frame first and stream the CSV from the Parquet file, so memory doesn't double
+            del df_gold
+            logger.info(f"Exporting Gold Data to {csv_path}...")
+            pl.scan_parquet(parquet_path).sink_csv(csv_path, engine="streaming")
 
         logger.info("Gold Layer processing complete.")
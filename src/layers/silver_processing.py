@@ -1,6 +1,7 @@
 from pathlib import Path
-from typing import Tuple, Union
+from typing import List, Tuple, Union
 
+import orjson
 import polars as pl
 
 # import pyarrow
@@ -12,10 +13,10 @@ logger = setup_logger(__name__)
 class SilverProcessor:
     """
     Handles the Silver Layer lifecycle:
-    1. Ingests Bronze Data (Path or DataFrame)
+    1. Ingests Bronze Data (Path, DataFrame or LazyFrame)
     2. Transforms & Standardizes
     3. Persists to Disk (in a partitioned Parquet)
-    4. Returns Data for the next layer
+    4. Returns Data for the next layer (DataFrame, or a LazyFrame over the written Parquet)
     """
 
     # Column selection and renaming
@@ -46,16 +47,35 @@ class SilverProcessor:
         "number_of_motorist_killed",
     ]
 
-    def process_collisions(self, input_data: Union[pl.DataFrame, Path], output_path: Path) -> Tuple[pl.DataFrame, Path]:
+    # Holiday impact flags, derived once from the API 'types' list
+    HOLIDAY_IMPACT_TYPES = {
+        "high_impact_holiday": ["Public", "Bank"],
+        "partial_impact_holiday": ["School", "Authorities"],
+        "low_impact_holiday": ["Optional", "Observance"],
+    }
+
+    def _sink_partitioned(self, q: pl.LazyFrame, output_path: Path, by: List[str]) -> pl.LazyFrame:
+        """
+        Streams the query straight into a hive-partitioned Parquet dataset (never materialized in memory)
+        and returns a lazy scan over what was written (an empty frame if the query yielded no rows).
+        """
+        q.sink_parquet(pl.PartitionByKey(output_path, by=by), mkdir=True, engine="streaming")
+        return pl.scan_parquet(output_path / "**/*.parquet", hive_partitioning=True, schema=q.collect_schema())
+
+    def process_collisions(
+        self, input_data: Union[pl.DataFrame, pl.LazyFrame, Path], output_path: Path
+    ) -> Tuple[pl.LazyFrame, Path]:
         """
-        Standardizes collisions, wirtes to Silver (Partitioned) and returns the DataFrame.
+        Standardizes collisions, streams them to Silver (Partitioned) and returns a LazyFrame over the written data.
         """
 
         logger.info("Processing Collisions (Bronze -> Silver)...")
 
         # 1. Load Input to LazyFrame
         if isinstance(input_data, Path):
-            lf = pl.scan_csv(input_data, ignore_errors=True)
+            lf = pl.scan_parquet(input_data)
+        elif isinstance(input_data, pl.LazyFrame):
+            lf = input_data
         elif isinstance(input_data, pl.DataFrame):
             lf = input_data.lazy()
         else:
@@ -70,7 +90,7 @@ class SilverProcessor:
                 [
                     pl.col("crash_date").str.to_date("%m/%d/%Y").alias("date"),
                     pl.col("borough").fill_null("UNKNOWN"),
-                    # clean up null metrics with 0s
+                    # clean up null metrics with 0s (the cast is a no-op on Bronze Parquet, already Int32)
                     pl.col(self.METRIC_COLS).fill_null(0).cast(pl.Int32),
                 ]
             )
@@ -85,18 +105,15 @@ class SilverProcessor:
             )
         )
 
-        # 3. Materialize (We need the DataFrame to persist it)
-        df_silver = q.collect()
-
-        # 4. Write to disk
+        # 3. Write to disk (streaming: parse + transform + partitioned write in a single pass)
         logger.info(f"Persisting Collisions Silver Layer to {output_path}...")
         clean_output_directory(output_path)
 
-        df_silver.write_parquet(output_path, partition_by=["year", "month"])
+        return self._sink_partitioned(q, output_path, by=["year", "month"]), output_path
 
-        return df_silver, output_path
-
-    def process_holidays(self, input_data: Union[pl.DataFrame, Path], output_path: Path) -> Tuple[pl.DataFrame, Path]:
+    def process_holidays(
+        self, input_data: Union[pl.DataFrame, pl.LazyFrame, Path], output_path: Path
+    ) -> Tuple[pl.DataFrame, Path]:
         """
         Standardizes holidays, writes to Silver and returns the DataFrame.
         """
@@ -105,7 +122,11 @@ class SilverProcessor:
 
         # 1. Load Input to LazyFrame
         if isinstance(input_data, Path):
-            lf = pl.read_json(input_data).lazy()
+            # orjson parses straight into Python records (C/Rust), built into a frame in one copy
+            records = orjson.loads(input_data.read_bytes())
+            lf = pl.from_dicts(records, infer_schema_length=None).lazy()
+        elif isinstance(input_data, pl.LazyFrame):
+            lf = input_data
         elif isinstance(input_data, pl.DataFrame):
             lf = input_data.lazy()
         else:
@@ -122,10 +143,16 @@ class SilverProcessor:
             )
             .with_columns(
                 [
+                    # Impact flags as booleans, so Gold doesn't scan the variable-length list for every collision
+                    *[
+                        pl.col("types").list.eval(pl.element().is_in(holiday_types)).list.any().alias(flag)
+                        for flag, holiday_types in self.HOLIDAY_IMPACT_TYPES.items()
+                    ],
                     pl.col("date").dt.year().alias("year"),
                     pl.col("date").dt.month().alias("month"),
                 ]
             )
+            .drop("types")
             .unique()
         )
 
@@ -140,16 +167,19 @@ class SilverProcessor:
 
         return df_silver, output_path
 
-    def process_weather(self, input_data: Union[pl.DataFrame, Path], output_path: Path) -> Tuple[pl.DataFrame, Path]:
+    def process_weather(
+        self, input_data: Union[pl.DataFrame, pl.LazyFrame, Path], output_path: Path
+    ) -> Tuple[pl.LazyFrame, Path]:
         """
-        Standardizes NOAA GHCN-Daily weather data, writes to Silver and returns the DataFrame.
+        Standardizes NOAA GHCN-Daily weather data, streams it to Silver and returns a LazyFrame over the written data.
         """
         logger.info("Processing Weather Data (Bronze -> Silver)...")
 
         # 1. Load Input to LazyFrame
         if isinstance(input_data, Path):
-            # 'infer_schema_length=0' we read all cols as String first to avoid errors with messy CSVs
-            lf = pl.scan_csv(input_data, ignore_errors=True, infer_schema_length=0)
+            lf = pl.scan_parquet(input_data)
+        elif isinstance(input_data, pl.LazyFrame):
+            lf = input_data
         elif isinstance(input_data, pl.DataFrame):
             lf = input_data.lazy()
         else:
@@ -162,41 +192,49 @@ class SilverProcessor:
         # SNOW = mm (whole numbers)
         # WT** Columns = "1" if event occurred, null otherwise.
 
+        # Bronze Parquet types were inferred from the CSV (unpadded readings come back as numbers): read them as text
+        raw_cols = ["DATE", "PRCP", "SNOW", "TMAX", "TMIN", "WT01", "WT02"]
+
         q = (
-            lf.filter(pl.col("DATE") >= "2020-01-01")
+            lf.with_columns(pl.col(raw_cols).cast(pl.String))
+            .filter(pl.col("DATE") >= "2020-01-01")
             .filter(pl.col("DATE").is_not_null())
+            # Parse the raw precipitation/snow readings once; every derived column below reuses them
+            .with_columns(
+                [
+                    pl.col("PRCP").str.strip_chars().cast(pl.Float64).alias("prcp_raw"),
+                    pl.col("SNOW").str.strip_chars().cast(pl.Float64).alias("snow_raw"),
+                ]
+            )
             .with_columns(
                 [
                     # Convert DATE string to Date object
                     pl.col("DATE").str.to_date("%Y-%m-%d").alias("date"),
                     # Convert Temperature (Tenths of C -> C)
-                    (pl.col("TMAX").str.strip_chars().cast(pl.Float64) / 10).round(1).alias("temp_max_c"),
-                    (pl.col("TMIN").str.strip_chars().cast(pl.Float64) / 10).round(1).alias("temp_min_c"),
+                    (pl.col("TMAX").str.strip_chars().cast(pl.Float64) / 10).round(1).alias("max_temp"),
+                    (pl.col("TMIN").str.strip_chars().cast(pl.Float64) / 10).round(1).alias("min_temp"),
                     # Convert Precipitation (Tenths of mm -> mm)
-                    (pl.col("PRCP").str.strip_chars().cast(pl.Float64) / 10).alias("precipitation_mm"),
-                    # Snow is already in mm, just cast it
-                    pl.col("SNOW").str.strip_chars().cast(pl.Float64).alias("snow_mm"),
+                    (pl.col("prcp_raw") / 10).alias("precipitation_mm"),
+                    # Snow is already in mm
+                    pl.col("snow_raw").alias("snow_mm"),
                     # --- Extract Weather Events (Fog, Rain, Snow) ---
                     # WT01 = Fog, ice fog, or freezing fog
                     # WT02 = Heavy fog
-                    # Logic: If either WT01 or WT02 is "1", it was foggy.
-                    pl.any_horizontal(
-                        pl.col("WT01").str.strip_chars().cast(pl.Int32, strict=False) == 1,
-                        pl.col("WT02").str.strip_chars().cast(pl.Int32, strict=False) == 1,
-                    )
+                    # Logic: If either WT01 or WT02 is "1", it was foggy (plain string comparison, no numeric cast).
+                    ((pl.col("WT01").str.strip_chars() == "1") | (pl.col("WT02").str.strip_chars() == "1"))
                     .fill_null(False)
                     .alias("is_foggy"),
                     # Basic Boolean flags for Rain/Snow based on measurements
-                    (pl.col("PRCP").str.strip_chars().cast(pl.Float64) > 0).fill_null(False).alias("has_rain"),
-                    (pl.col("SNOW").str.strip_chars().cast(pl.Float64) > 0).fill_null(False).alias("has_snow"),
+                    (pl.col("prcp_raw") > 0).fill_null(False).alias("has_rain"),
+                    (pl.col("snow_raw") > 0).fill_null(False).alias("has_snow"),
                 ]
             )
             # Select only the clean columns we want to keep
             .select(
                 [
                     "date",
-                    "temp_max_c",
-                    "temp_min_c",
+                    "max_temp",
+                    "min_temp",
                     "precipitation_mm",
                     "snow_mm",
                     "is_foggy",
@@ -213,13 +251,8 @@ class SilverProcessor:
             )
         )
 
-        # 3. Materialize
-        df_silver = q.collect()
-
-        # 4. Write to Disk (Partitioned)
+        # 3. Write to Disk (Partitioned, streaming: the string parsing/casting runs batch by batch)
         logger.info(f"Persisting Weather Silver Layer to {output_path}...")
         clean_output_directory(output_path)
 
-        df_silver.write_parquet(output_path, partition_by=["year", "month"])
-
-        return df_silver, output_path
+        return self._sink_partitioned(q, output_path, by=["year", "month"]), output_path
@@ -1,21 +1,26 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from src.layers.bronze_processing import BronzeExtractor
+from src.layers.bronze_processing import COLLISION_SCHEMA, BronzeExtractor
 from src.layers.gold_processing import GoldProcessor
 from src.layers.silver_processing import SilverProcessor
 
-from .utils import ensure_directories, load_config, setup_logger
+from .utils import configure_logging, ensure_directories, load_config, setup_logger
 
 logger = setup_logger("Pipeline")
 
 
-def run_pipeline():
+def run_pipeline(emit_csv: bool = False):
+    """
+    Runs Bronze -> Silver -> Gold. emit_csv also exports the Gold table as CSV (for Excel users).
+    """
     try:
         # --- 0. SETUP ---
         config = load_config()
-        # Ensure base directories exist (bronze, silver, gold)
+        # Ensure base directories exist (bronze, silver, gold). Bronze writes straight into them
         ensure_directories(config["paths"])
+        bronze_root = Path(config["paths"]["bronze"])
 
         # Dependency Injection
         bronze_processor = BronzeExtractor(config)
@@ -25,68 +30,85 @@ def run_pipeline():
         # --- PHASE 1: BRONZE (Ingestion) ---
         logger.info(" PHASE 1: INGESTION ")
 
-        # I am working with both df and files in order to accelerate the processing (with df) and simulate a bronze>silver>gold architecture writing onto S3 for example
-
-        # 1.1 Ingest Collisions
-        logger.info("Ingesting Collisions data...")
-
-        # Config source variables
-        collisions_url = config["sources"]["collisions"]["url"]
-        collisions_filename = config["sources"]["collisions"]["filename"]
-        collisions_output_path = Path(config["paths"]["bronze"]) / collisions_filename
-
-        df_collisions_bronze, path_collisions_bronze = bronze_processor.download_file_from_url(
-            url=collisions_url, output_path=collisions_output_path
-        )
-
-        # 1.2 Ingest Holidays
-        logger.info("Ingesting Holidays data...")
-
-        # Config source variables
-        holidays_conf = config["sources"]["holidays"]
-        holidays_output_path = Path(config["paths"]["bronze"]) / holidays_conf["filename"]
-
-        df_holidays_bronze, path_holidays_bronze = bronze_processor.fetch_holidays(
-            base_url=holidays_conf["url_base"],
-            country=holidays_conf["country_code"],
-            years=holidays_conf["years"],
-            output_path=holidays_output_path,
-        )
-
-        # 1.3 Ingest historical NYC weather
-        logger.info("Ingesting Collisions data...")
-
-        # Config source variables
-        weather_url = config["sources"]["weather"]["url"]
-        weather_filename = config["sources"]["weather"]["filename"]
-        weather_output_path = Path(config["paths"]["bronze"]) / weather_filename
-
-        df_weather_bronze, path_weather_bronze = bronze_processor.download_file_from_url(
-            url=weather_url, output_path=weather_output_path
-        )
+        # Silver reads the CSV sources back from their Bronze Parquet files (simulating a bronze>silver>gold architecture writing onto S3 for example), holidays are passed on as a df
+
+        # The three sources are independent: holidays are fetched in the background while both CSVs download
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="bronze") as executor:
+            # 1.1 Ingest Collisions
+            logger.info("Ingesting Collisions data...")
+
+            # Config source variables
+            collisions_url = config["sources"]["collisions"]["url"]
+            collisions_filename = config["sources"]["collisions"]["filename"]
+            collisions_output_path = bronze_root / collisions_filename
+
+            # 1.2 Ingest Holidays
+            logger.info("Ingesting Holidays data...")
+
+            # Config source variables
+            holidays_conf = config["sources"]["holidays"]
+            holidays_output_path = bronze_root / holidays_conf["filename"]
+
+            holidays_future = executor.submit(
+                bronze_processor.fetch_holidays,
+                base_url=holidays_conf["url_base"],
+                country=holidays_conf["country_code"],
+                years=holidays_conf["years"],
+                output_path=holidays_output_path,
+            )
+
+            # 1.3 Ingest historical NYC weather
+            logger.info("Ingesting Weather data...")
+
+            # Config source variables
+            weather_url = config["sources"]["weather"]["url"]
+            weather_filename = config["sources"]["weather"]["filename"]
+            weather_output_path = bronze_root / weather_filename
+
+            # Both CSV downloads run concurrently
+            collisions_result, weather_result = bronze_processor.download_many(
+                [
+                    {"url": collisions_url, "output_path": collisions_output_path, "schema_overrides": COLLISION_SCHEMA},
+                    {"url": weather_url, "output_path": weather_output_path},
+                ]
+            )
+            _, path_collisions_bronze = collisions_result
+            _, path_weather_bronze = weather_result
+
+            # Wait for the holidays too before moving to Silver (re-raises any ingestion error)
+            df_holidays_bronze, _ = holidays_future.result()
 
         # --- PHASE 2: SILVER (Transform & Standardize) ---
         logger.info(" PHASE 2: SILVER LAYER ")
 
         silver_base_path = Path(config["paths"]["silver"])
 
-        # 2.1 Process Collisions
-        df_collisions_silver, path_collisions_silver = silver_processor.process_collisions(
-            input_data=df_collisions_bronze,  # path_collisions_bronze
-            output_path=silver_base_path / "collisions",
-        )
-
-        # 2.2 Process Holidays
-        df_holidays_silver, path_holidays_silver = silver_processor.process_holidays(
-            input_data=df_holidays_bronze,  # path_holidays_bronze
-            output_path=silver_base_path / "holidays",
-        )
-
-        # 2.3 Process Weather
-        df_weather_silver, path_weather_silver = silver_processor.process_weather(
-            input_data=df_weather_bronze,  # path_weather_bronze
-            output_path=silver_base_path / "weather",
-        )
+        # The three tables are independent (disjoint output folders) and Polars releases the GIL, so they run concurrently
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="silver") as executor:
+            # 2.1 Process Collisions
+            collisions_future = executor.submit(
+                silver_processor.process_collisions,
+                input_data=path_collisions_bronze,
+                output_path=silver_base_path / "collisions",
+            )
+
+            # 2.2 Process Holidays
+            holidays_future = executor.submit(
+                silver_processor.process_holidays,
+                input_data=df_holidays_bronze,
+                output_path=silver_base_path / "holidays",
+            )
+
+            # 2.3 Process Weather
+            weather_future = executor.submit(
+                silver_processor.process_weather,
+                input_data=path_weather_bronze,
+                output_path=silver_base_path / "weather",
+            )
+
+            lf_collisions_silver, path_collisions_silver = collisions_future.result()
+            df_holidays_silver, path_holidays_silver = holidays_future.result()
+            lf_weather_silver, path_weather_silver = weather_future.result()
 
         # --- PHASE 3: GOLD ---
         logger.info(" PHASE 3: GOLD LAYER ")
@@ -94,10 +116,11 @@ def run_pipeline():
         # I'll be passing df directly to keep data in memory. In a production environment this steps would be separate and we'd mnst likely read from a file
 
         gold_processor.process_gold_data(
-            collisions_data=df_collisions_silver,
+            collisions_data=lf_collisions_silver,
             holidays_data=df_holidays_silver,
-            weather_data=df_weather_silver,
+            weather_data=lf_weather_silver,
             gold_base_path=Path(config["paths"]["gold"]),
+            write_csv=emit_csv,
         )
 
         logger.info("Pipeline Finished Successfully.")
@@ -108,4 +131,5 @@ def run_pipeline():
 
 
 if __name__ == "__main__":
+    configure_logging()
     run_pipeline()
@@ -1,63 +1,193 @@
 import logging
+import os
 import shutil
+import tempfile
+import threading
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, List, Mapping
 
+import orjson
 import requests
 import yaml
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+# Define retry strategy: stop crashing on 500, 502, 503 errors
+_RETRY = Retry(
+    total=5,  # Total retry attempts
+    backoff_factor=0.3,  # Wait 0.3s, 0.6s, 1.2s...
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset(["GET", "HEAD"]),
+)
+
+# Built once at import and mounted by every session, so they all share its connection pools.
+# One pool per host (up to 16 hosts), each with enough keep-alive connections for every concurrent Bronze worker
+# (3 sources + per-year holidays), so they reuse TCP/TLS connections. pool_block=False: never wait for a free slot
+_ADAPTER = HTTPAdapter(max_retries=_RETRY, pool_connections=16, pool_maxsize=32, pool_block=False)
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# LibYAML C loader when PyYAML was built with it, pure-Python SafeLoader otherwise (same results)
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def configure_logging(verbose: bool = False):
+    """
+    Configures the root handler once per process. Only entry points call this;
+    modules just ask for a named logger, so importing them has no logging side effects.
+    """
+    level = logging.DEBUG if verbose else logging.INFO
+
+    root = logging.getLogger()
+    if not root.handlers:
+        logging.basicConfig(format=LOG_FORMAT, level=level)
+    else:
+        root.setLevel(level)
+
 
 def setup_logger(name: str) -> logging.Logger:
-    logging.basicConfig(
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        level=logging.INFO,
-    )
     return logging.getLogger(name)
 
 
-def load_config(config_path: str = "config/config.yaml") -> dict:
-    with open(config_path, "r") as f:
-        return yaml.safe_load(f)
+def load_config(config_path: str = "config/config.yaml") -> Mapping:
+    """
+    Parses the YAML config, cached per resolved path and returned frozen (read-only mappings, tuples).
+    A JSON copy (config.yaml.json) is reused across processes while the YAML's mtime and size are unchanged.
+    """
+    return _load_config(Path(config_path).resolve())
+
+
+@lru_cache(maxsize=8)
+def _load_config(yaml_path: Path) -> Mapping:
+    cache_path = yaml_path.with_name(f"{yaml_path.name}.json")
+
+    # Exact match, not "cache is newer": a YAML swapped in with an older mtime (cp -p, rsync -t, a backup) must be re-read
+    yaml_stat = yaml_path.stat()
+    source = [yaml_stat.st_mtime_ns, yaml_stat.st_size]
+    try:
+        cached = orjson.loads(cache_path.read_bytes())
+        if cached["source"] == source:
+            frozen: Mapping = _freeze(cached["config"])
+            return frozen
+    except (OSError, ValueError, KeyError, TypeError):
+        # Missing, unreadable, corrupt or old-format cache: fall back to the YAML
+        pass
+
+    with open(yaml_path, "rb") as f:
+        config = yaml.load(f, Loader=YAML_LOADER)  # nosec B506
+
+    _write_config_cache(config, source, cache_path)
+    frozen = _freeze(config)
+    return frozen
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively turns dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _write_config_cache(config: dict, source: List[int], cache_path: Path):
+    """Writes the JSON copy atomically (temp file + os.replace), so readers never see a half-written cache."""
+    try:
+        # Dates are rejected instead of silently coming back as strings
+        payload = orjson.dumps({"source": source, "config": config}, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    except TypeError:
+        # A value JSON can't represent (e.g. YAML dates): just keep parsing the YAML
+        return
+
+    # Same for values that don't survive the round trip (.nan/.inf are written as null)
+    if orjson.loads(payload)["config"] != config:
+        return
+
+    try:
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{cache_path.name}.", dir=cache_path.parent)
+    except OSError:
+        # Read-only folder: just keep parsing the YAML
+        return
+
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
 
 
 def ensure_directory(path: Path):
     """Ensure the parent directory exists and creates it if not."""
-    if not path.parent.exists():
-        path.parent.mkdir(parents=True, exist_ok=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
 
 
-def ensure_directories(paths: dict):
+def ensure_directories(paths: Mapping):
     """Ensure the parent directories exists and creates them if not."""
-    for path in paths.values():
-        Path(path).mkdir(parents=True, exist_ok=True)
+    # Deepest first, remembering ancestors, so nested or duplicated paths cost no extra syscalls
+    created = set()
+    for path in sorted({os.path.normpath(p) for p in paths.values()}, key=lambda p: p.count(os.sep), reverse=True):
+        if path in created:
+            continue
+        if not os.path.isdir(path):
+            os.makedirs(path, exist_ok=True)
+
+        # Remember the folder and its ancestors (stops at the root, or at a folder already remembered)
+        while path and path not in created:
+            created.add(path)
+            path = os.path.dirname(path)
 
 
 def clean_output_directory(path: Path):
     """Internal helper to ensure idempotency, basically cleaning up directories to avoid duplication of data"""
-    if path.exists() and path.is_dir():
-        shutil.rmtree(path)
+    if path.is_dir():
+        # Rename the old tree away (atomic) and delete it in the background instead of waiting on rmtree
+        trash = Path(tempfile.mkdtemp(prefix=f".{path.name}.trash-", dir=path.parent))
+        path.rename(trash / path.name)
+
+        # Trash left over by runs that exited before their background delete finished is swept as well
+        stale = list(path.parent.glob(f".{path.name}.trash-*"))
+        threading.Thread(target=_remove_trees, args=(stale,), name=f"clean-{path.name}", daemon=True).start()
+
     path.mkdir(parents=True, exist_ok=True)
 
 
+def _remove_trees(paths: List[Path]):
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+@lru_cache(maxsize=1)
 def setup_session() -> requests.Session:
     """
     Configures a session with automatic retries and a User-Agent.
-    This prevents the pipeline from crashing on temporary network issues.
+    This prevents the pipeline from crashing on temporary network issues. Shared by the whole process.
     """
-    session = requests.Session()
-
-    # Define retry strategy: stop crashing on 500, 502, 503 errors
-    retry_strategy = Retry(
-        total=3,  # Total retry attempts
-        backoff_factor=1,  # Wait 1s, 2s, 4s...
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["HEAD", "GET", "OPTIONS"],
-    )
-
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount("https://", adapter)
-    session.mount("http://", adapter)
+    return _configure_session(requests.Session())
+
+
+def setup_cached_session(cache_path: Path, expire_after: int = 86400) -> requests.Session:
+    """
+    Same as setup_session, with responses cached on disk by requests-cache (meant for small API responses only).
+    Falls back to the shared plain session if requests-cache can't be imported.
+    """
+    try:
+        # Optional dependency, imported only when caching is enabled
+        import requests_cache
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"requests-cache is unavailable ({e}), HTTP responses won't be cached.")
+        return setup_session()
+
+    session = requests_cache.CachedSession(cache_name=str(cache_path), backend="sqlite", expire_after=expire_after)
+    return _configure_session(session)
+
+
+def _configure_session(session: requests.Session) -> requests.Session:
+    session.mount("https://", _ADAPTER)
+    session.mount("http://", _ADAPTER)
 
     # To avoid 403 Forbidden on public APIs
     session.headers.update({"User-Agent": "NYCCollisionETL/1.0"})
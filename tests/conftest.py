@@ -0,0 +1,9 @@
+"""Shared fixtures."""
+import pytest
+from src.utils import load_config
+
+
+@pytest.fixture(scope="session")
+def real_config():
+    """Project configuration, parsed once for the whole test run."""
+    return load_config("config/config.yaml")
@@ -2,13 +2,18 @@
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
+import io
+import sys
+import types
 import polars as pl
+import requests
+import urllib3
 from src.layers.bronze_processing import BronzeExtractor
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_config():
-    """Mock configuration."""
+    """Mock configuration (shared by the whole run, don't mutate it)."""
     return {
         "paths": {
             "bronze": "data/bronze",
@@ -22,7 +27,7 @@ def mock_config():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def bronze_extractor(mock_config):
     """Create BronzeExtractor instance."""
     return BronzeExtractor(mock_config)
@@ -35,26 +40,171 @@ def test_bronze_extractor_init(mock_config):
     assert extractor.session is not None
 
 
-@patch("src.layers.bronze_processing.pl.read_csv")
-@patch("src.layers.bronze_processing.Path.exists")
-@patch("builtins.open", create=True)
-def test_download_file_from_url_cached(mock_open, mock_exists, mock_read_csv, bronze_extractor, tmp_path):
+@patch("src.layers.bronze_processing.pl.scan_csv")
+def test_download_file_from_url_cached(mock_scan_csv, bronze_extractor, tmp_path):
     """Test file download when file is already cached."""
     output_path = tmp_path / "test.csv"
-    mock_exists.return_value = True
+    output_path.write_text("col1\n1\n2\n3\n")
+    pl.DataFrame({"col1": [1, 2, 3]}).write_parquet(output_path.with_suffix(".parquet"))
     
-    # Create a dummy dataframe
-    mock_df = pl.DataFrame({"col1": [1, 2, 3]})
-    mock_read_csv.return_value = mock_df
+    with patch.object(bronze_extractor.session, "get") as mock_get:
+        lf, path = bronze_extractor.download_file_from_url(
+            url="https://example.com/data.csv",
+            output_path=output_path,
+        )
     
-    df, path = bronze_extractor.download_file_from_url(
+    assert isinstance(lf, pl.LazyFrame)
+    assert path == output_path.with_suffix(".parquet")
+    assert lf.collect()["col1"].to_list() == [1, 2, 3]
+    # Cached CSV and Parquet are reused: nothing is downloaded and the CSV is not parsed again
+    mock_get.assert_not_called()
+    mock_scan_csv.assert_not_called()
+
+
+def test_download_file_from_url_writes_body(bronze_extractor, tmp_path):
+    """Test that the response body is written to disk and converted to Parquet."""
+    output_path = tmp_path / "data.csv"
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.raw = io.BytesIO(b"col1\n1\n2\n")
+    
+    with patch.object(bronze_extractor.session, "get", return_value=response):
+        lf, path = bronze_extractor.download_file_from_url(
+            url="https://example.com/data.csv",
+            output_path=output_path,
+        )
+    
+    assert output_path.read_bytes() == b"col1\n1\n2\n"
+    assert path == output_path.with_suffix(".parquet")
+    assert lf.collect()["col1"].to_list() == [1, 2]
+
+
+def test_download_file_from_url_network_error(bronze_extractor, tmp_path):
+    """Test that a failed download surfaces the error and removes the partial file."""
+    output_path = tmp_path / "data.csv"
+    
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.raw.read.side_effect = [b"col1\n", urllib3.exceptions.ProtocolError("connection reset")]
+    
+    with patch.object(bronze_extractor.session, "get", return_value=response):
+        with pytest.raises(urllib3.exceptions.ProtocolError):
+            bronze_extractor.download_file_from_url(
+                url="https://example.com/data.csv",
+                output_path=output_path,
+            )
+    
+    assert not output_path.exists()
+
+
+@patch("src.layers.bronze_processing.pl.scan_csv")
+def test_download_file_from_url_failed_conversion(mock_scan_csv, bronze_extractor, tmp_path):
+    """Test that a failed CSV -> Parquet conversion leaves no Parquet file to be reused as cached."""
+    output_path = tmp_path / "data.csv"
+    output_path.write_text("col1\n1\n")
+    
+    def broken_sink(path, **kwargs):
+        Path(path).write_bytes(b"")
+        raise pl.exceptions.ComputeError("ragged row")
+    
+    mock_scan_csv.return_value.sink_parquet.side_effect = broken_sink
+    
+    with pytest.raises(pl.exceptions.ComputeError):
+        bronze_extractor.download_file_from_url(
+            url="https://example.com/data.csv",
+            output_path=output_path,
+        )
+    
+    assert list(tmp_path.iterdir()) == [output_path]
+
+
+def test_download_file_from_url_schema_overrides(bronze_extractor, tmp_path):
+    """Test that known dtypes are applied, and overrides for columns missing from the CSV are ignored."""
+    output_path = tmp_path / "collisions.csv"
+    output_path.write_text("COLLISION_ID,BOROUGH,EXTRA\n1,QUEENS,x\n")
+    
+    lf, path = bronze_extractor.download_file_from_url(
         url="https://example.com/data.csv",
         output_path=output_path,
+        schema_overrides={"COLLISION_ID": pl.UInt64, "LATITUDE": pl.Float64, "BOROUGH": pl.String},
     )
     
-    assert df is not None
-    assert path == output_path
-    mock_read_csv.assert_called_once()
+    assert lf.collect_schema() == {"COLLISION_ID": pl.UInt64, "BOROUGH": pl.String, "EXTRA": pl.String}
+    assert path == tmp_path / "collisions.parquet"
+
+
+def test_download_many_keeps_input_order(bronze_extractor, tmp_path):
+    """Test that concurrent downloads return one result per request, in input order."""
+    downloads = [
+        {"url": f"https://example.com/{name}.csv", "output_path": tmp_path / f"{name}.csv"}
+        for name in ["collisions", "weather"]
+    ]
+    
+    def fake_download(url, output_path):
+        return pl.LazyFrame(), output_path.with_suffix(".parquet")
+    
+    with patch.object(bronze_extractor, "download_file_from_url", side_effect=fake_download):
+        results = bronze_extractor.download_many(downloads)
+    
+    assert [path.name for _, path in results] == ["collisions.parquet", "weather.parquet"]
+
+
+def test_fetch_holidays_keeps_year_order(bronze_extractor, tmp_path):
+    """Test that concurrent per-year fetches are merged in year order and failed years are skipped."""
+    def fake_get(url, timeout):
+        year = url.split("/")[-2]
+        if year == "2021":
+            raise requests.exceptions.ConnectionError("API down")
+        response = MagicMock()
+        response.json.return_value = [{"date": f"{year}-01-01", "name": "New Year's Day", "types": ["Public"]}]
+        return response
+    
+    with patch.object(bronze_extractor.session, "get", side_effect=fake_get):
+        df, path = bronze_extractor.fetch_holidays(
+            base_url="https://example.com/holidays",
+            country="US",
+            years=[2020, 2021, 2022, 2023],
+            output_path=tmp_path / "holidays.json",
+        )
+    
+    assert df["date"].to_list() == ["2020-01-01", "2022-01-01", "2023-01-01"]
+    assert path.exists()
+
+
+def test_cache_http_without_requests_cache(mock_config):
+    """Test that cache_http falls back to the shared session when requests-cache isn't installed."""
+    config = {**mock_config, "sources": {"holidays": {"cache_http": True}}}
+    
+    with patch.dict(sys.modules, {"requests_cache": None}):
+        extractor = BronzeExtractor(config)
+    
+    assert extractor.api_session is extractor.session
+
+
+def test_cache_http_with_requests_cache(mock_config):
+    """Test that cache_http routes holiday requests through a requests-cache session under the bronze folder."""
+    config = {**mock_config, "sources": {"holidays": {"cache_http": True}}}
+    
+    class StubCachedSession(requests.Session):
+        def __init__(self, **kwargs):
+            super().__init__()
+            self.cache_kwargs = kwargs
+    
+    stub_module = types.ModuleType("requests_cache")
+    stub_module.CachedSession = StubCachedSession
+    
+    with patch.dict(sys.modules, {"requests_cache": stub_module}):
+        extractor = BronzeExtractor(config)
+    
+    assert isinstance(extractor.api_session, StubCachedSession)
+    assert extractor.api_session is not extractor.session
+    assert extractor.api_session.cache_kwargs == {
+        "cache_name": str(Path("data/bronze") / ".http_cache.sqlite"),
+        "backend": "sqlite",
+        "expire_after": 86400,
+    }
+    assert extractor.api_session.get_adapter("https://date.nager.at") is extractor.session.get_adapter("https://date.nager.at")
+    assert extractor.api_session.headers["User-Agent"] == "NYCCollisionETL/1.0"
 
 
 def test_fetch_holidays_structure(mock_config):
@@ -0,0 +1,97 @@
+"""Unit tests for Gold layer processing (fed by the Silver layer)."""
+import pytest
+import polars as pl
+from src.layers.gold_processing import GoldProcessor
+from src.layers.silver_processing import SilverProcessor
+
+
+@pytest.fixture
+def silver_tables(tmp_path):
+    """Tiny Bronze-shaped dataset run through the Silver layer."""
+    metrics = {col: [1, 2, 4, 8] for col in SilverProcessor.COLLISION_RENAME_MAP if col.startswith("NUMBER OF")}
+    collisions = pl.DataFrame(
+        {
+            "CRASH DATE": ["12/31/2019", "01/01/2020", "01/01/2020", "01/02/2020"],
+            "CRASH TIME": ["10:00", "11:00", "12:00", "13:00"],
+            "BOROUGH": ["QUEENS", "BROOKLYN", "BROOKLYN", None],
+            "ZIP CODE": [11101, 11201, 11201, None],
+            **metrics,
+            "CONTRIBUTING FACTOR VEHICLE 1": ["Unspecified"] * 4,
+        }
+    )
+    holidays = pl.DataFrame(
+        {
+            "date": ["2019-12-31", "2020-01-01", "2020-01-02"],
+            "name": ["New Year's Eve", "New Year's Day", "Day After"],
+            "types": [["Observance"], ["Public", "Bank"], ["Observance"]],
+        }
+    )
+    weather = pl.DataFrame(
+        {
+            "DATE": ["2019-12-31", "2020-01-01", "2020-01-02"],
+            "PRCP": ["   10", "    0", "    5"],
+            "SNOW": ["    0", "    0", "    0"],
+            "TMAX": ["  100", "   55", "   80"],
+            "TMIN": ["    0", "  -10", "   20"],
+            "WT01": [None, "    1", None],
+            "WT02": [None, None, None],
+        }
+    )
+    
+    silver = SilverProcessor()
+    silver_path = tmp_path / "silver"
+    lf_collisions, _ = silver.process_collisions(collisions, silver_path / "collisions")
+    df_holidays, _ = silver.process_holidays(holidays, silver_path / "holidays")
+    lf_weather, _ = silver.process_weather(weather, silver_path / "weather")
+    return lf_collisions, df_holidays, lf_weather
+
+
+def test_silver_holidays_precomputed_flags(silver_tables):
+    """Test that Silver stores the impact flags instead of the raw types list."""
+    _, df_holidays, _ = silver_tables
+    df = df_holidays.sort("date")
+    
+    assert "types" not in df.columns
+    assert df["high_impact_holiday"].to_list() == [False, True, False]
+    assert df["low_impact_holiday"].to_list() == [True, False, True]
+    assert df["partial_impact_holiday"].to_list() == [False, False, False]
+
+
+def test_silver_collision_metrics_int32(silver_tables):
+    """Test that in-memory Bronze frames (Int64 counts) still land in Silver with Int32 metrics."""
+    lf_collisions, _, _ = silver_tables
+    schema = lf_collisions.collect_schema()
+    
+    assert all(schema[col] == pl.Int32 for col in SilverProcessor.METRIC_COLS)
+
+
+def test_gold_daily_stats(silver_tables, tmp_path):
+    """Test the Gold aggregation: holiday flags, weather columns and pruning of pre-2020 collisions."""
+    lf_collisions, df_holidays, lf_weather = silver_tables
+    gold_path = tmp_path / "gold"
+    
+    GoldProcessor().process_gold_data(lf_collisions, df_holidays, lf_weather, gold_base_path=gold_path)
+    df = pl.read_parquet(gold_path / "daily_stats.parquet").sort("date", "borough")
+    
+    assert "max_temp" in df.columns and "min_temp" in df.columns
+    assert "temp_max_c" not in df.columns
+    # The 2019 collision is dropped, the two 2020-01-01 collisions are aggregated together
+    assert df["date"].dt.year().min() == 2020
+    assert df["total_accidents"].to_list() == [2, 1]
+    assert df["holiday_name"].to_list() == ["New Year's Day", "Day After"]
+    assert df["high_impact_holiday"].to_list() == [True, False]
+    assert df["low_impact_holiday"].to_list() == [False, True]
+    assert df["max_temp"].to_list() == [5.5, 8.0]
+    assert df["is_foggy"].to_list() == [True, False]
+    assert df["borough"].to_list() == ["BROOKLYN", "UNKNOWN"]
+    assert not (gold_path / "daily_stats.csv").exists()
+
+
+def test_gold_csv_export_opt_in(silver_tables, tmp_path):
+    """Test that write_csv exports the same rows as the Parquet output."""
+    lf_collisions, df_holidays, lf_weather = silver_tables
+    gold_path = tmp_path / "gold"
+    
+    GoldProcessor().process_gold_data(lf_collisions, df_holidays, lf_weather, gold_base_path=gold_path, write_csv=True)
+    
+    assert pl.read_csv(gold_path / "daily_stats.csv").height == pl.read_parquet(gold_path / "daily_stats.parquet").height
@@ -0,0 +1,49 @@
+"""Unit tests for Silver layer processing."""
+import pytest
+import polars as pl
+from src.layers.silver_processing import SilverProcessor
+
+
+def test_process_weather_numeric_bronze(tmp_path):
+    """Test that weather readings inferred as numbers by the Bronze Parquet conversion are still parsed."""
+    bronze_path = tmp_path / "weather_raw.parquet"
+    pl.DataFrame(
+        {
+            "DATE": ["2019-12-31", "2020-01-01", "2020-01-02"],
+            "PRCP": [5, 0, 12],
+            "SNOW": [0, 0, 3],
+            "TMAX": [100, 55, -12],
+            "TMIN": [0, -10, -40],
+            "WT01": [None, 1, None],
+            "WT02": [None, None, None],
+        }
+    ).write_parquet(bronze_path)
+    
+    lf, _ = SilverProcessor().process_weather(bronze_path, tmp_path / "silver" / "weather")
+    df = lf.collect().sort("date")
+    
+    assert df["max_temp"].to_list() == [5.5, -1.2]
+    assert df["precipitation_mm"].to_list() == pytest.approx([0.0, 1.2])
+    assert df["is_foggy"].to_list() == [True, False]
+    assert df["has_snow"].to_list() == [False, True]
+
+
+def test_process_weather_no_recent_rows(tmp_path):
+    """Test that weather with no rows from 2020 on yields an empty frame instead of failing on collect."""
+    df_bronze = pl.DataFrame(
+        {
+            "DATE": ["2018-06-01", "2019-12-31"],
+            "PRCP": ["5", "0"],
+            "SNOW": ["0", "0"],
+            "TMAX": ["100", "55"],
+            "TMIN": ["0", "-10"],
+            "WT01": [None, "1"],
+            "WT02": [None, None],
+        }
+    )
+    
+    lf, _ = SilverProcessor().process_weather(df_bronze, tmp_path / "silver" / "weather")
+    df = lf.collect()
+    
+    assert df.height == 0
+    assert "max_temp" in df.columns
@@ -1,11 +1,18 @@
 """Unit tests for utility functions."""
 import pytest
 from pathlib import Path
+import datetime
+import logging
+import math
+import os
 from src.utils import (
+    configure_logging,
     setup_logger,
     load_config,
+    _load_config,
     ensure_directory,
     ensure_directories,
+    clean_output_directory,
     setup_session,
 )
 
@@ -17,9 +24,30 @@ def test_setup_logger():
     assert logger.name == "test_logger"
 
 
-def test_load_config():
+def test_setup_logger_is_idempotent():
+    """Test that repeated calls return the same logger without stacking handlers (records propagate to root)."""
+    logger = setup_logger("test_logger")
+    assert setup_logger("test_logger") is logger
+    assert logger.handlers == []
+    assert logger.propagate
+
+
+def test_configure_logging_verbose():
+    """Test that --verbose lowers the root level to DEBUG."""
+    root = logging.getLogger()
+    original_level = root.level
+    try:
+        configure_logging(verbose=True)
+        assert root.level == logging.DEBUG
+        configure_logging()
+        assert root.level == logging.INFO
+    finally:
+        root.setLevel(original_level)
+
+
+def test_load_config(real_config):
     """Test configuration loading."""
-    config = load_config("config/config.yaml")
+    config = real_config
     assert config is not None
     assert "paths" in config
     assert "sources" in config
@@ -28,6 +56,61 @@ def test_load_config():
     assert "gold" in config["paths"]
 
 
+def test_load_config_is_cached():
+    """Test that repeated loads reuse the parsed config, whatever the path spelling, and that it is read-only."""
+    config = load_config("config/config.yaml")
+    assert config is load_config(os.path.abspath("config/config.yaml"))
+    
+    with pytest.raises(TypeError):
+        config["paths"] = {}
+    with pytest.raises(TypeError):
+        config["paths"]["bronze"] = "elsewhere"
+    with pytest.raises(AttributeError):
+        config["sources"]["holidays"]["years"].append(2030)
+
+
+def test_load_config_json_cache(tmp_path):
+    """Test that the JSON copy is written, and ignored once the YAML changes (even to an older mtime)."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("paths:\n  bronze: data/bronze\n")
+    _load_config.cache_clear()
+    
+    assert load_config(str(config_path)) == {"paths": {"bronze": "data/bronze"}}
+    cache_path = tmp_path / "config.yaml.json"
+    assert cache_path.exists()
+    _load_config.cache_clear()
+    
+    assert load_config(str(config_path)) == {"paths": {"bronze": "data/bronze"}}
+    
+    config_path.write_text("paths:\n  bronze: other/bronze\n")
+    os.utime(config_path, (cache_path.stat().st_mtime - 100,) * 2)
+    _load_config.cache_clear()
+    
+    assert load_config(str(config_path)) == {"paths": {"bronze": "other/bronze"}}
+
+
+def test_load_config_skips_json_cache_for_dates(tmp_path):
+    """Test that a config with YAML dates is not cached as JSON (they would come back as strings)."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("start: 2020-01-01\n")
+    _load_config.cache_clear()
+    
+    assert load_config(str(config_path))["start"] == datetime.date(2020, 1, 1)
+    assert not (tmp_path / "config.yaml.json").exists()
+
+
+def test_load_config_skips_json_cache_for_non_finite_floats(tmp_path):
+    """Test that a config with .nan/.inf is not cached as JSON (they would come back as null)."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("threshold: .nan\nlimit: .inf\n")
+    _load_config.cache_clear()
+    
+    config = load_config(str(config_path))
+    assert math.isnan(config["threshold"])
+    assert config["limit"] == math.inf
+    assert not (tmp_path / "config.yaml.json").exists()
+
+
 def test_load_config_invalid_path():
     """Test configuration loading with invalid path."""
     with pytest.raises(FileNotFoundError):
@@ -54,6 +137,30 @@ def test_ensure_directories(tmp_path):
     assert Path(paths["gold"]).exists()
 
 
+def test_ensure_directories_nested(tmp_path):
+    """Test that nested and duplicated paths are all created."""
+    paths = {
+        "data": str(tmp_path / "data"),
+        "bronze": str(tmp_path / "data" / "bronze"),
+        "bronze_copy": str(tmp_path / "data" / "bronze"),
+    }
+    ensure_directories(paths)
+    assert Path(paths["data"]).is_dir()
+    assert Path(paths["bronze"]).is_dir()
+
+
+def test_clean_output_directory(tmp_path):
+    """Test that existing output is cleared and the directory is recreated empty."""
+    output = tmp_path / "silver" / "collisions"
+    (output / "year=2020").mkdir(parents=True)
+    (output / "year=2020" / "0.parquet").write_bytes(b"old")
+    
+    clean_output_directory(output)
+    
+    assert output.is_dir()
+    assert list(output.iterdir()) == []
+
+
 def test_setup_session():
     """Test session setup with retries."""
     session = setup_session()
@@ -61,3 +168,8 @@ def test_setup_session():
     assert "User-Agent" in session.headers
     assert session.headers["User-Agent"] == "NYCCollisionETL/1.0"
 
+
+def test_setup_session_is_shared():
+    """Test that every caller gets the same session (and so the same connection pools)."""
+    assert setup_session() is setup_session()
+